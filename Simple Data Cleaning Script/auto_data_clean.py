@@ -5,8 +5,183 @@ This module provides the AutoDataClean class that allows you to selectively
 apply various data cleaning operations to pandas DataFrames.
 """
 
+import csv
+import logging
+import os
+import warnings
+from typing import Optional
+
+import numpy as np
 import pandas as pd
 
+logger = logging.getLogger(__name__)
+
+# Copy-on-Write lets the cleaning steps share untouched column blocks with the
+# input instead of copying them. It is opt-in on pandas 2.x and always on from 3.0.
+PANDAS_MAJOR = int(pd.__version__.split('.')[0])
+if PANDAS_MAJOR == 2:
+    pd.set_option("mode.copy_on_write", True)
+
+# try importing optional deps
+try:
+    import polars as pl
+    HAS_POLARS = True
+except ImportError:
+    HAS_POLARS = False
+    pl = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pv
+    import pyarrow.parquet as pq
+    # Arrow-backed pandas columns need pd.ArrowDtype (pandas >= 1.5)
+    HAS_PYARROW = hasattr(pd, 'ArrowDtype')
+except ImportError:
+    HAS_PYARROW = False
+    pa = None
+    pc = None
+    pv = None
+    pq = None
+
+try:
+    import duckdb
+    HAS_DUCKDB = True
+except ImportError:
+    HAS_DUCKDB = False
+    duckdb = None
+
+try:
+    import dask
+    import dask.dataframe as dd
+    HAS_DASK = True
+except ImportError:
+    HAS_DASK = False
+    dask = None
+    dd = None
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Bytes of CSV parsed per block by the multithreaded pyarrow reader
+ARROW_BLOCK_SIZE = 64 << 20
+
+# Below this many rows pandas' duplicated() is already fast enough
+NUMBA_MIN_ROWS = 10_000
+
+
+if HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _numba_dedup(arr):
+        """
+        Return a keep-mask marking the first occurrence of each row of a 2D
+        int64 array, found in a single hashed pass.
+        """
+        n_rows, n_cols = arr.shape
+        
+        # FNV-1a style hash over the 64-bit words of each row
+        hashes = np.empty(n_rows, dtype=np.uint64)
+        for i in prange(n_rows):
+            h = np.uint64(14695981039346656037)
+            for j in range(n_cols):
+                h = (h ^ np.uint64(arr[i, j])) * np.uint64(1099511628211)
+            # fmix64 finalizer: the FNV product barely mixes into the low bits
+            # used as the slot, e.g. integral floats differ only in high bits
+            h ^= h >> np.uint64(33)
+            h *= np.uint64(0xff51afd7ed558ccd)
+            h ^= h >> np.uint64(33)
+            h *= np.uint64(0xc4ceb9fe1a85ec53)
+            h ^= h >> np.uint64(33)
+            hashes[i] = h
+        
+        # Open-addressing table of row numbers, at most half full
+        n_slots = 1
+        while n_slots < 2 * n_rows:
+            n_slots *= 2
+        slots = np.full(n_slots, -1, dtype=np.int64)
+        slot_mask = np.uint64(n_slots - 1)
+        
+        keep = np.ones(n_rows, dtype=np.bool_)
+        for i in range(n_rows):
+            h = hashes[i]
+            slot = h & slot_mask
+            while slots[slot] != -1:
+                first = slots[slot]
+                if hashes[first] == h:
+                    same = True
+                    for j in range(n_cols):
+                        if arr[i, j] != arr[first, j]:
+                            same = False
+                            break
+                    if same:
+                        keep[i] = False
+                        break
+                slot = (slot + np.uint64(1)) & slot_mask
+            else:
+                slots[slot] = i
+        return keep
+
+
+def _numeric_rows(df):
+    """
+    Return the frame as a C-ordered 2D int64 array whose rows compare equal
+    exactly when pandas considers them duplicates, or None if the frame is
+    not made only of numpy integer or numpy float columns.
+    """
+    dtypes = list(df.dtypes)
+    if not dtypes or not all(isinstance(dtype, np.dtype) for dtype in dtypes):
+        return None
+    kinds = {dtype.kind for dtype in dtypes}
+    if kinds == {'i'}:
+        return np.ascontiguousarray(df.to_numpy(dtype=np.int64))
+    if kinds == {'f'}:
+        arr = np.array(df.to_numpy(dtype=np.float64), order='C')
+        # Normalise -0.0 and NaN payloads so equal values share a bit pattern
+        arr += 0.0
+        arr[np.isnan(arr)] = np.nan
+        return arr.view(np.int64)
+    return None
+
+
+def _optimize_dtypes(df):
+    """
+    Convert string columns, held as Python objects or in pandas' ``string``
+    dtype (the default for text from pandas 3 on), to dtypes that pandas can
+    hash without touching Python objects: ``category`` for low-cardinality
+    columns, Arrow-backed strings otherwise (when pyarrow is available).
+    """
+    # labels are not necessarily strings, so map label -> dtype for astype;
+    # repeated labels cannot be addressed one column at a time and are skipped
+    is_object = (df.dtypes == object).to_numpy()
+    is_string = np.array([isinstance(dtype, pd.StringDtype) for dtype in df.dtypes],
+                         dtype=bool)
+    candidates = (is_object | is_string) & ~df.columns.duplicated(keep=False)
+    new_dtypes = {}
+    for col, string_dtype in zip(df.columns[candidates], is_string[candidates]):
+        values = df[col]
+        if not string_dtype and pd.api.types.infer_dtype(values, skipna=True) != 'string':
+            continue
+        if values.nunique() < 0.5 * len(values):
+            new_dtypes[col] = 'category'
+        elif HAS_PYARROW and not (string_dtype and values.dtype.storage == 'pyarrow'):
+            # pyarrow-backed ``string`` columns are already hashed natively
+            new_dtypes[col] = pd.ArrowDtype(pa.string())
+    if not new_dtypes:
+        return df
+    return df.astype(new_dtypes)
+
+
+def _duplicated_mask(df):
+    """Boolean numpy mask of rows that repeat an earlier row."""
+    if HAS_NUMBA and len(df) >= NUMBA_MIN_ROWS:
+        arr = _numeric_rows(df)
+        if arr is not None:
+            return ~_numba_dedup(arr)
+    return df.duplicated(keep='first').to_numpy()
+
 
 class AutoDataClean:
     """
@@ -18,6 +193,12 @@ class AutoDataClean:
         If True, removes duplicate rows from the dataset.
     remove_nulls : bool, default=True
         If True, removes rows containing null/missing values.
+    optimize_dtypes : bool, default=False
+        If True, converts string columns (object or ``string`` dtype) to ``category`` or
+        Arrow-backed strings before cleaning, and the cleaned frame keeps the
+        converted dtypes. The conversion itself costs a pass over each such
+        column, so this pays off when the cleaned frame is used further
+        (smaller memory, faster hashing and grouping), not for a single clean.
     
     Attributes
     ----------
@@ -25,6 +206,8 @@ class AutoDataClean:
         Flag indicating whether to remove duplicates.
     remove_nulls : bool
         Flag indicating whether to remove null values.
+    optimize_dtypes : bool
+        Flag indicating whether to convert string columns before cleaning.
     
     Examples
     --------
@@ -43,7 +226,8 @@ class AutoDataClean:
     >>> df_cleaned = cleaner.clean(df)
     """
     
-    def __init__(self, remove_duplicates: bool = True, remove_nulls: bool = True):
+    def __init__(self, remove_duplicates: bool = True, remove_nulls: bool = True,
+                 optimize_dtypes: bool = False):
         """
         Initialize the AutoDataClean instance with cleaning options.
         
@@ -53,53 +237,206 @@ class AutoDataClean:
             Whether to remove duplicate rows.
         remove_nulls : bool, default=True
             Whether to remove rows with null values.
+        optimize_dtypes : bool, default=False
+            Whether to convert string columns to faster dtypes first.
         """
         self.remove_duplicates = remove_duplicates
         self.remove_nulls = remove_nulls
+        self.optimize_dtypes = optimize_dtypes
     
-    def clean(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+    def clean(self, df, inplace: bool = False, backend: str = 'auto',
+              return_stats: bool = False, duplicated=None):
         """
         Clean the DataFrame based on the configured options.
         
         Parameters
         ----------
-        df : pd.DataFrame
+        df : pd.DataFrame or pl.DataFrame
             The input DataFrame to clean.
         inplace : bool, default=False
-            If True, modifies the original DataFrame. If False, returns a copy.
+            Deprecated and ignored. The input is never modified; use the
+            returned DataFrame.
+        backend : {'auto', 'pandas', 'polars', 'dask'}, default='auto'
+            Engine used for cleaning. 'auto' cleans polars frames with polars
+            and pandas frames with pandas; other engines are only used when
+            asked for. 'polars' also
+            routes pandas input through polars and converts the result back to
+            pandas (Arrow-backed dtypes, fresh RangeIndex). 'dask' splits a
+            pandas frame into one partition per core and cleans them in
+            parallel; row order is not preserved. Scheduling has a fixed
+            overhead, so it only pays off on large frames. ``optimize_dtypes``
+            is only supported by the pandas backend.
+        return_stats : bool, default=False
+            If True, also return a dict with the 'duplicates_removed' and
+            'nulls_removed' row counts.
+        duplicated : np.ndarray, optional
+            Boolean mask of duplicate rows in ``df``, as returned by
+            ``get_summary(df, return_duplicated=True)``. It is used instead of
+            scanning for duplicates again, so it must describe ``df`` as it is
+            now. Only supported by the pandas backend.
         
         Returns
         -------
-        pd.DataFrame
-            The cleaned DataFrame.
+        pd.DataFrame or pl.DataFrame
+            The cleaned DataFrame, of the same type as the input. When
+            return_stats=True, a ``(df, stats)`` tuple instead.
         
         Notes
         -----
         - Duplicate removal is performed first, then null removal.
-        - The original DataFrame is not modified unless inplace=True.
+        - The original DataFrame is never modified.
         """
-        if not inplace:
-            df = df.copy()
+        if inplace:
+            warnings.warn(
+                "The 'inplace' argument is deprecated and has no effect; "
+                "use the returned DataFrame instead.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
         
-        original_rows = len(df)
+        if backend not in ('auto', 'pandas', 'polars', 'dask'):
+            raise ValueError(f"Unknown backend: {backend!r}")
         
-        if self.remove_duplicates:
-            df.drop_duplicates(inplace=True)
-            duplicates_removed = original_rows - len(df)
-            print(f"Removed {duplicates_removed} duplicate rows.")
+        is_polars = HAS_POLARS and isinstance(df, pl.DataFrame)
+        if is_polars and backend in ('pandas', 'dask'):
+            raise ValueError(f"backend={backend!r} cannot clean a polars DataFrame")
+        original_rows = df.height if is_polars else len(df)
         
-        rows_before_null_removal = len(df)
+        if duplicated is not None:
+            if is_polars or backend not in ('auto', 'pandas'):
+                raise ValueError("duplicated is only supported by the pandas backend")
+            duplicated = np.asarray(duplicated, dtype=bool)
+            if duplicated.shape != (len(df),):
+                raise ValueError("duplicated must have one entry per row of df")
         
-        if self.remove_nulls:
-            df.dropna(inplace=True)
-            nulls_removed = rows_before_null_removal - len(df)
-            print(f"Removed {nulls_removed} rows with null values.")
+        if self.optimize_dtypes and (is_polars or backend not in ('auto', 'pandas')):
+            raise ValueError("optimize_dtypes is only supported by the pandas backend")
         
-        print(f"Cleaning complete. Original rows: {original_rows}, Final rows: {len(df)}")
+        if backend == 'dask':
+            if not HAS_DASK:
+                raise ImportError("backend='dask' requires dask to be installed")
+            df, stats = self._clean_dask(df)
+        elif backend == 'polars' or is_polars:
+            if not HAS_POLARS:
+                raise ImportError("backend='polars' requires polars to be installed")
+            if is_polars:
+                df, stats = self._clean_polars(df)
+            else:
+                df, stats = self._clean_polars(pl.from_pandas(df))
+                df = df.to_pandas(use_pyarrow_extension_array=True)
+        else:
+            df, stats = self._clean_pandas(df, duplicated)
         
+        logger.debug("Cleaning complete. Original rows: %d, Final rows: %d",
+                     original_rows, len(df))
+        
+        if return_stats:
+            return df, stats
         return df
     
-    def get_summary(self, df: pd.DataFrame) -> dict:
+    def _clean_pandas(self, df, duplicated=None):
+        """Apply the configured cleaning operations to a pandas DataFrame."""
+        if self.optimize_dtypes:
+            df = _optimize_dtypes(df)
+        
+        # Build one keep-mask for both operations so the frame is sliced once
+        keep = np.ones(len(df), dtype=bool)
+        duplicates_removed = 0
+        nulls_removed = 0
+        all_null = None
+        
+        if self.remove_nulls:
+            null_cells = df.isna().to_numpy()
+            # a flat any() over the cell mask is much cheaper than the
+            # per-row reduction, so only do the latter if nulls exist
+            any_nulls = bool(null_cells.any())
+            if any_nulls:
+                all_null = null_cells.all(axis=0)
+                if not all_null.any():
+                    all_null = None
+        
+        if all_null is not None:
+            # A column that is entirely null puts a null in every row, so every
+            # row is dropped. Those columns hold the same value in every row,
+            # so duplicates are found on the remaining columns alone, which
+            # keeps the counts in line with the polars and dask backends.
+            keep[:] = False
+            if self.remove_duplicates:
+                if duplicated is None:
+                    if all_null.all():
+                        duplicated = np.arange(len(df)) > 0
+                    else:
+                        duplicated = _duplicated_mask(df.loc[:, ~all_null])
+                duplicates_removed = int(duplicated.sum())
+            nulls_removed = len(df) - duplicates_removed
+            logger.debug("Removed %d duplicate rows.", duplicates_removed)
+            logger.debug("Removed %d rows with null values.", nulls_removed)
+        else:
+            if self.remove_duplicates:
+                if duplicated is None:
+                    duplicated = _duplicated_mask(df)
+                duplicates_removed = int(duplicated.sum())
+                if duplicates_removed:
+                    keep &= ~duplicated
+                logger.debug("Removed %d duplicate rows.", duplicates_removed)
+            
+            if self.remove_nulls:
+                if any_nulls:
+                    has_nulls = null_cells.any(axis=1)
+                    # only count rows that survived duplicate removal
+                    nulls_removed = int((has_nulls & keep).sum())
+                    keep &= ~has_nulls
+                logger.debug("Removed %d rows with null values.", nulls_removed)
+        
+        if keep.all():
+            # Already clean: skip the slice. Under Copy-on-Write a shallow
+            # copy is enough to keep the input safe from later edits.
+            df = df.copy(deep=PANDAS_MAJOR < 2)
+        else:
+            df = df.loc[keep]
+        
+        return df, {'duplicates_removed': duplicates_removed, 'nulls_removed': nulls_removed}
+    
+    def _clean_polars(self, df):
+        """Apply the configured cleaning operations to a polars DataFrame."""
+        duplicates_removed = 0
+        nulls_removed = 0
+        
+        if self.remove_duplicates:
+            rows_before = df.height
+            df = df.unique(maintain_order=True)
+            duplicates_removed = rows_before - df.height
+            logger.debug("Removed %d duplicate rows.", duplicates_removed)
+        
+        if self.remove_nulls:
+            rows_before = df.height
+            df = df.drop_nulls()
+            nulls_removed = rows_before - df.height
+            logger.debug("Removed %d rows with null values.", nulls_removed)
+        
+        return df, {'duplicates_removed': duplicates_removed, 'nulls_removed': nulls_removed}
+    
+    def _clean_dask(self, df):
+        """Apply the configured cleaning operations to a pandas DataFrame with dask."""
+        # keep the input dtypes instead of dask's default string conversion
+        with dask.config.set({'dataframe.convert-string': False}):
+            ddf = dd.from_pandas(df, npartitions=os.cpu_count() or 1)
+            deduped = ddf.drop_duplicates() if self.remove_duplicates else ddf
+            cleaned = deduped.dropna() if self.remove_nulls else deduped
+            
+            # one compute so the shared drop_duplicates step only runs once
+            deduped_rows, cleaned_df = dask.compute(deduped.shape[0], cleaned)
+        
+        duplicates_removed = len(df) - int(deduped_rows)
+        nulls_removed = int(deduped_rows) - len(cleaned_df)
+        if self.remove_duplicates:
+            logger.debug("Removed %d duplicate rows.", duplicates_removed)
+        if self.remove_nulls:
+            logger.debug("Removed %d rows with null values.", nulls_removed)
+        
+        return cleaned_df, {'duplicates_removed': duplicates_removed, 'nulls_removed': nulls_removed}
+    
+    def get_summary(self, df: pd.DataFrame, return_duplicated: bool = False) -> dict:
         """
         Get a summary of potential cleaning operations without modifying the data.
         
@@ -107,6 +444,9 @@ class AutoDataClean:
         ----------
         df : pd.DataFrame
             The DataFrame to analyze.
+        return_duplicated : bool, default=False
+            If True, also return the boolean mask of duplicate rows, which can
+            be passed to ``clean(df, duplicated=...)`` to skip a second scan.
         
         Returns
         -------
@@ -116,55 +456,357 @@ class AutoDataClean:
             - 'duplicate_rows': Number of duplicate rows
             - 'rows_with_nulls': Number of rows containing null values
             - 'null_counts_per_column': Null counts for each column
+            When return_duplicated=True, a ``(summary, duplicated)`` tuple
+            instead.
         """
-        return {
+        duplicated = _duplicated_mask(df)
+        
+        # Build the null mask once and derive both null summaries from it
+        null_mask = df.isna()
+        summary = {
             'total_rows': len(df),
-            'duplicate_rows': df.duplicated().sum(),
-            'rows_with_nulls': df.isnull().any(axis=1).sum(),
-            'null_counts_per_column': df.isnull().sum().to_dict()
+            'duplicate_rows': int(duplicated.sum()),
+            'rows_with_nulls': int(null_mask.any(axis=1).sum()),
+            'null_counts_per_column': null_mask.sum().to_dict()
         }
+        if return_duplicated:
+            return summary, duplicated
+        return summary
 
 
 def clean_data(filepath: str, output_filepath: str = None, 
-               remove_duplicates: bool = True, remove_nulls: bool = True) -> pd.DataFrame:
+               remove_duplicates: bool = True, remove_nulls: bool = True,
+               chunksize: int = 1_000_000, backend: str = 'pandas',
+               return_df: bool = True) -> Optional[pd.DataFrame]:
     """
     Convenience function to clean a CSV file directly.
     
+    The file is read and cleaned in chunks, and each cleaned chunk is appended
+    to the output file as soon as it is ready, so the raw file is never held
+    in memory as a whole. With pyarrow the file is streamed twice in blocks:
+    once as text to settle each column's type, then to clean it. Without
+    pyarrow ``pd.read_csv`` streams it ``chunksize`` rows at a time.
+    
+    Neither reader parses dates, so date and timestamp columns are kept as
+    text and written back to CSV exactly as they appeared in the input.
+    
+    Output is written as zstd-compressed Parquet unless ``output_filepath``
+    ends in '.csv'. Parquet is typically several times smaller than CSV and
+    faster to write and read back, at the cost of not being human-readable.
+    
     Parameters
     ----------
     filepath : str
         Path to the input CSV file.
     output_filepath : str, optional
-        Path to save the cleaned CSV. If None, appends '_cleaned' to the original filename.
+        Path to save the cleaned data, as Parquet unless it ends in '.csv'.
+        If None, writes '<name>_cleaned.parquet' next to the input file.
     remove_duplicates : bool, default=True
-        Whether to remove duplicate rows.
+        Whether to remove duplicate rows. Duplicates are detected across
+        chunks using a running set of row hashes.
     remove_nulls : bool, default=True
         Whether to remove rows with null values.
+    chunksize : int, default=1_000_000
+        Number of CSV rows to read and clean at a time. Only used when
+        pyarrow is not installed; the pyarrow reader streams the file in
+        blocks of ``ARROW_BLOCK_SIZE`` bytes, parsed across all cores,
+        instead.
+    backend : {'pandas', 'duckdb'}, default='pandas'
+        'duckdb' runs the whole file-to-file job as one DuckDB query, which
+        uses all cores and spills to disk, so files larger than memory can
+        be cleaned. The data never enters pandas and row order is not kept.
+        DuckDB also infers column types its own way, so the output text can
+        differ from the pandas path: numbers with leading zeros such as
+        ``007`` stay strings (pandas reads 7), booleans are written as
+        ``true``/``false`` rather than ``True``/``False``, and timestamps
+        are parsed and written as ``2020-01-01 10:00:00``.
+    return_df : bool, default=True
+        Whether to also collect the cleaned rows into a DataFrame and return
+        it. Collecting makes peak memory grow with the cleaned output; pass
+        False to keep it bounded by a single chunk for files larger than RAM.
     
     Returns
     -------
-    pd.DataFrame
-        The cleaned DataFrame.
+    pd.DataFrame or None
+        The cleaned DataFrame. When pyarrow is installed it is built from the
+        batches of ``clean_data_arrow``, so columns are Arrow-backed and the
+        index is a fresh RangeIndex. None when return_df=False or with
+        backend='duckdb', where the result is only written to
+        ``output_filepath``.
     
     Examples
     --------
     >>> df_cleaned = clean_data('data.csv', 'data_cleaned.csv')
     """
-    # Load the dataset
-    df = pd.read_csv(filepath)
+    if output_filepath is None:
+        output_filepath = os.path.splitext(filepath)[0] + '_cleaned.parquet'
+    write_parquet = not output_filepath.lower().endswith('.csv')
+    
+    if backend == 'duckdb':
+        _clean_data_duckdb(filepath, output_filepath, write_parquet,
+                           remove_duplicates, remove_nulls)
+        logger.info("Cleaned data saved to: %s", output_filepath)
+        return None
+    if backend != 'pandas':
+        raise ValueError(f"Unknown backend: {backend!r}")
+    
+    if not HAS_PYARROW:
+        if write_parquet:
+            raise ImportError("Writing Parquet output requires pyarrow to be installed")
+        chunks = _clean_chunks(pd.read_csv(filepath, chunksize=chunksize),
+                               remove_duplicates, remove_nulls)
+        cleaned_chunks = []
+        for i, chunk in enumerate(chunks):
+            chunk.to_csv(output_filepath, mode='w' if i == 0 else 'a',
+                         header=(i == 0), index=False)
+            if return_df:
+                cleaned_chunks.append(chunk)
+        logger.info("Cleaned data saved to: %s", output_filepath)
+        return pd.concat(cleaned_chunks) if return_df else None
+    
+    batches = clean_data_arrow(filepath, remove_duplicates, remove_nulls)
+    cleaned_batches = []
+    if write_parquet:
+        with pq.ParquetWriter(output_filepath, batches.schema, compression='zstd') as writer:
+            for batch in batches:
+                writer.write_batch(batch)
+                if return_df:
+                    cleaned_batches.append(batch)
+    else:
+        # pyarrow's CSV writer quotes every string value; to_csv only quotes
+        # fields that need it, which keeps the established output format
+        batches.schema.empty_table().to_pandas().to_csv(output_filepath, index=False)
+        for batch in batches:
+            batch.to_pandas(types_mapper=pd.ArrowDtype).to_csv(
+                output_filepath, mode='a', header=False, index=False)
+            if return_df:
+                cleaned_batches.append(batch)
+    
+    logger.info("Cleaned data saved to: %s", output_filepath)
+    
+    if not return_df:
+        return None
+    table = pa.Table.from_batches(cleaned_batches, schema=batches.schema)
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def clean_data_arrow(filepath: str, remove_duplicates: bool = True,
+                     remove_nulls: bool = True):
+    """
+    Clean a CSV file as a stream of Arrow record batches.
+    
+    The file is parsed with pyarrow's multithreaded streaming CSV reader and
+    cleaned one block at a time, with duplicates detected across blocks.
+    Only one block is held in memory at a time; see ``_read_arrow_csv`` for
+    how column types are kept stable across blocks.
+    Nothing is serialized, so the result can be handed to Arrow consumers
+    without copying, e.g. ``polars.from_arrow(reader)`` or
+    ``duckdb.arrow(reader)``.
     
-    # Create cleaner and clean the data
+    Parameters
+    ----------
+    filepath : str
+        Path to the input CSV file.
+    remove_duplicates : bool, default=True
+        Whether to remove duplicate rows.
+    remove_nulls : bool, default=True
+        Whether to remove rows with null values.
+    
+    Returns
+    -------
+    pa.RecordBatchReader
+        A reader over the cleaned batches. Iterating it yields
+        ``pa.RecordBatch`` objects; its ``schema`` is known up front.
+    
+    Examples
+    --------
+    >>> for batch in clean_data_arrow('data.csv'):
+    ...     print(batch.num_rows)
+    """
+    if not HAS_PYARROW:
+        raise ImportError("clean_data_arrow requires pyarrow to be installed")
+    
+    schema, raw_batches = _read_arrow_csv(filepath)
+    chunks = _clean_chunks(_arrow_batches_to_pandas(raw_batches),
+                           remove_duplicates, remove_nulls)
+    batches = (pa.RecordBatch.from_pandas(chunk, schema=schema, preserve_index=False)
+               for chunk in chunks)
+    return pa.RecordBatchReader.from_batches(schema, batches)
+
+
+# Types a text column may be read as, each followed by the wider types that
+# can still hold every value it accepted
+_WIDER_TYPES = {
+    None: ['int64', 'double', 'bool', 'string'],
+    'int64': ['int64', 'double', 'string'],
+    'double': ['double', 'string'],
+    'bool': ['bool', 'string'],
+}
+
+
+def _read_arrow_csv(filepath):
+    """
+    Stream a CSV file as Arrow record batches with one schema for the file.
+    
+    pv.open_csv fixes each column's type from the first block and fails when a
+    later block does not fit it. Instead the file is streamed once as text to
+    find, per column, the narrowest of int64, double, bool and string that
+    holds every value, then streamed again as text with each block cast to
+    those types. Both passes hold one block at a time. Columns that are empty
+    throughout are read as strings. Dates and timestamps are never inferred,
+    matching pd.read_csv, so they keep their original text. Repeated header names are renamed the way
+    pd.read_csv renames them (``a``, ``a.1``, ...).
+    
+    Returns the schema and an iterator of record batches.
+    """
+    with open(filepath, newline='', encoding='utf-8-sig') as f:
+        header = next(csv.reader(f), None)
+    if not header:
+        raise pd.errors.EmptyDataError("No columns to parse from file")
+    header = _dedup_names(header)
+    
+    def open_as_text():
+        return pv.open_csv(
+            filepath,
+            read_options=pv.ReadOptions(use_threads=True, block_size=ARROW_BLOCK_SIZE,
+                                        column_names=header, skip_rows=1),
+            convert_options=pv.ConvertOptions(
+                column_types={name: pa.string() for name in header},
+                strings_can_be_null=True),
+        )
+    
+    type_names = [None] * len(header)
+    for batch in open_as_text():
+        for i, column in enumerate(batch.columns):
+            type_names[i] = _widen_text_type(type_names[i], column)
+    
+    types = [pa.type_for_alias(name or 'string') for name in type_names]
+    schema = pa.schema(list(zip(header, types)))
+    
+    def cast_batches():
+        for batch in open_as_text():
+            yield pa.RecordBatch.from_arrays(
+                [pc.cast(column, t) for column, t in zip(batch.columns, types)],
+                schema=schema)
+    
+    return schema, cast_batches()
+
+
+def _dedup_names(names):
+    """Rename repeated column names to ``name.1``, ``name.2``, ... as pd.read_csv does."""
+    taken = set(names)
+    counts = {}
+    deduped = []
+    for name in names:
+        base = name
+        count = counts.get(base, 0)
+        while count > 0:
+            counts[base] = count + 1
+            name = f"{base}.{count}"
+            count = count + 1 if name in taken else counts.get(name, 0)
+        counts[name] = count + 1
+        deduped.append(name)
+    return deduped
+
+
+def _widen_text_type(type_name, column):
+    """Return the narrowest type at or above type_name that parses every value."""
+    values = column.drop_null()
+    if len(values) == 0:
+        return type_name
+    for candidate in _WIDER_TYPES[type_name]:
+        if candidate == 'string':
+            return candidate
+        try:
+            pc.cast(values, pa.type_for_alias(candidate))
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            continue
+        return candidate
+
+
+def _clean_chunks(chunks, remove_duplicates, remove_nulls):
+    """Clean an iterable of pandas chunks, dropping rows seen in earlier chunks."""
     cleaner = AutoDataClean(remove_duplicates=remove_duplicates, remove_nulls=remove_nulls)
-    df_cleaned = cleaner.clean(df)
+    seen_hashes = set()
     
-    # Save if output path provided
-    if output_filepath is None:
-        output_filepath = filepath.replace('.csv', '_cleaned.csv')
+    for chunk in chunks:
+        chunk = cleaner.clean(chunk)
+        
+        # Drop rows that already appeared in an earlier chunk
+        if remove_duplicates:
+            hashes = _chunk_row_hashes(chunk)
+            seen = np.fromiter((h in seen_hashes for h in hashes), dtype=bool, count=len(hashes))
+            # only pay for a second slice when a repeat was actually found
+            if seen.any():
+                chunk = chunk.loc[~seen]
+            seen_hashes.update(hashes)
+        
+        yield chunk
+
+
+def _chunk_row_hashes(df):
+    """
+    Hash each row so that equal rows match across chunks even when a numeric
+    column was inferred as int64 in one chunk and float64 in another.
+    
+    Integral float values are hashed as int64, so 1 and 1.0 hash the same.
+    """
+    column_hashes = {}
+    for i in range(df.shape[1]):
+        values = df.iloc[:, i]
+        dtype = values.dtype
+        if isinstance(dtype, np.dtype) and dtype.kind == 'i':
+            hashes = pd.util.hash_array(values.to_numpy(dtype=np.int64))
+        elif isinstance(dtype, np.dtype) and dtype.kind == 'f':
+            arr = values.to_numpy(dtype=np.float64)
+            hashes = pd.util.hash_array(arr)
+            with np.errstate(invalid='ignore'):
+                integral = np.isfinite(arr) & (arr == np.trunc(arr)) & (np.abs(arr) < 2.0 ** 63)
+            if integral.any():
+                hashes[integral] = pd.util.hash_array(arr[integral].astype(np.int64))
+        else:
+            hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+        column_hashes[i] = hashes
+    return pd.util.hash_pandas_object(pd.DataFrame(column_hashes, index=df.index),
+                                      index=False).to_numpy()
+
+
+def _clean_data_duckdb(filepath, output_filepath, write_parquet,
+                       remove_duplicates, remove_nulls):
+    """Clean a CSV file into ``output_filepath`` with a single DuckDB query."""
+    if not HAS_DUCKDB:
+        raise ImportError("backend='duckdb' requires duckdb to be installed")
+    
+    def quote_literal(value):
+        return "'" + value.replace("'", "''") + "'"
     
-    df_cleaned.to_csv(output_filepath, index=False)
-    print(f"Cleaned data saved to: {output_filepath}")
+    def quote_identifier(name):
+        return '"' + name.replace('"', '""') + '"'
     
-    return df_cleaned
+    source = f"read_csv_auto({quote_literal(filepath)})"
+    query = f"SELECT {'DISTINCT ' if remove_duplicates else ''}* FROM {source}"
+    
+    con = duckdb.connect()
+    try:
+        if remove_nulls:
+            columns = [row[0] for row in con.execute(f"DESCRIBE SELECT * FROM {source}").fetchall()]
+            if columns:
+                query += " WHERE " + " AND ".join(
+                    f"{quote_identifier(col)} IS NOT NULL" for col in columns)
+        options = "FORMAT PARQUET, COMPRESSION ZSTD" if write_parquet else "FORMAT CSV, HEADER"
+        con.execute(f"COPY ({query}) TO {quote_literal(output_filepath)} ({options})")
+    finally:
+        con.close()
+
+
+def _arrow_batches_to_pandas(batches):
+    """Yield Arrow record batches as pandas frames with a continuous index."""
+    offset = 0
+    for batch in batches:
+        df = batch.to_pandas(types_mapper=pd.ArrowDtype)
+        df.index = pd.RangeIndex(offset, offset + len(df))
+        offset += len(df)
+        yield df
 
 
 if __name__ == "__main__":
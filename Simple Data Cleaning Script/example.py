@@ -31,15 +31,17 @@ def main():
     print("=" * 50)
     cleaner1 = AutoDataClean(remove_duplicates=True, remove_nulls=True)
     
-    # Get summary before cleaning
-    summary = cleaner1.get_summary(df)
+    # Get summary before cleaning, keeping the duplicate mask for clean()
+    summary, duplicated = cleaner1.get_summary(df, return_duplicated=True)
     print(f"\nBefore cleaning:")
     print(f"  - Duplicate rows: {summary['duplicate_rows']}")
     print(f"  - Rows with nulls: {summary['rows_with_nulls']}")
     print(f"  - Null counts per column: {summary['null_counts_per_column']}")
     
     print("\nCleaning...")
-    df_cleaned1 = cleaner1.clean(df)
+    df_cleaned1, stats = cleaner1.clean(df, return_stats=True, duplicated=duplicated)
+    print(f"  - Removed {stats['duplicates_removed']} duplicate rows")
+    print(f"  - Removed {stats['nulls_removed']} rows with null values")
     print(f"\nResult:\n{df_cleaned1}")
     
     # Example 2: Remove only duplicates
@@ -0,0 +1,262 @@
+"""
+Tests for the AutoDataClean class and the clean_data helpers.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import auto_data_clean
+from auto_data_clean import AutoDataClean, clean_data, clean_data_arrow
+
+
+def test_clean_data_dedups_across_chunks_with_dtype_drift(tmp_path, monkeypatch):
+    # the pandas reader infers int64 for the first chunk and float64 for the second
+    monkeypatch.setattr(auto_data_clean, 'HAS_PYARROW', False)
+    src = tmp_path / 'in.csv'
+    src.write_text("a,b\n1,2\n3,4\n1,2\n1.5,9\n")
+    out = tmp_path / 'out.csv'
+    
+    clean_data(str(src), str(out), chunksize=2)
+    
+    result = pd.read_csv(out)
+    assert result.values.tolist() == [[1, 2], [3, 4], [1.5, 9]]
+
+
+def test_clean_data_handles_type_drift_across_arrow_blocks(tmp_path, monkeypatch):
+    # with tiny blocks the first ones only ever see integers in column 'a'
+    monkeypatch.setattr(auto_data_clean, 'ARROW_BLOCK_SIZE', 16)
+    src = tmp_path / 'in.csv'
+    src.write_text("a,b\n" + "".join(f"{i},{i}\n" for i in range(20)) + "1.5,x\n")
+    out = tmp_path / 'out.parquet'
+    
+    result = clean_data(str(src), str(out))
+    
+    assert len(result) == 21
+    assert result['a'].iloc[-1] == 1.5
+    assert len(pd.read_parquet(out)) == 21
+
+
+def test_clean_data_csv_output_matches_to_csv_quoting(tmp_path):
+    src = tmp_path / 'in.csv'
+    src.write_text('a,b\n1,x\n2,"y,z"\n')
+    out = tmp_path / 'out.csv'
+    
+    clean_data(str(src), str(out))
+    
+    assert out.read_text() == 'a,b\n1,x\n2,"y,z"\n'
+
+
+def test_clean_data_csv_output_keeps_timestamp_text(tmp_path):
+    src = tmp_path / 'in.csv'
+    src.write_text("a,t\n1,2020-01-01T10:00:00\n1,2020-01-01T10:00:00\n2,2020-01-02\n")
+    out = tmp_path / 'out.csv'
+    
+    clean_data(str(src), str(out))
+    
+    assert out.read_text() == "a,t\n1,2020-01-01T10:00:00\n2,2020-01-02\n"
+
+
+@pytest.mark.skipif(not auto_data_clean.HAS_DUCKDB, reason="duckdb is not installed")
+def test_clean_data_duckdb_backend_matches_pandas(tmp_path):
+    src = tmp_path / 'in.csv'
+    src.write_text('id,name,flag\n'
+                   '1,"Smith, J",true\n'
+                   '1,"Smith, J",true\n'
+                   '2,,false\n'
+                   '3,Lee,false\n')
+    
+    frames = []
+    for backend in ('pandas', 'duckdb'):
+        out = tmp_path / f'{backend}.csv'
+        clean_data(str(src), str(out), backend=backend, return_df=False)
+        # duckdb does not keep row order
+        frames.append(pd.read_csv(out).sort_values('id', ignore_index=True))
+    
+    pd.testing.assert_frame_equal(frames[0], frames[1])
+    assert frames[0]['name'].tolist() == ['Smith, J', 'Lee']
+
+
+def test_clean_data_renames_repeated_header_names_like_read_csv(tmp_path):
+    src = tmp_path / 'in.csv'
+    src.write_text("a,a,b\n1,2,3\n1,2,3\n4,5,6\n")
+    out = tmp_path / 'out.csv'
+    
+    result = clean_data(str(src), str(out))
+    
+    assert list(result.columns) == ['a', 'a.1', 'b']
+    assert len(result) == 2
+    assert out.read_text() == 'a,a.1,b\n1,2,3\n4,5,6\n'
+
+
+def test_clean_data_writes_parquet_unless_csv_suffix(tmp_path):
+    src = tmp_path / 'in.csv'
+    src.write_text("a,b\n1,x\n1,x\n")
+    out = tmp_path / 'out.pq'
+    
+    clean_data(str(src), str(out))
+    
+    assert pd.read_parquet(out).shape == (1, 2)
+
+
+def test_optimize_dtypes_with_non_string_column_labels():
+    df = pd.DataFrame([['a', 'b'], ['a', 'c'], ['a', 'b']], dtype=object)
+    
+    result = AutoDataClean(optimize_dtypes=True).clean(df)
+    
+    assert len(result) == 2
+    assert isinstance(result[0].dtype, pd.CategoricalDtype)
+
+
+def test_optimize_dtypes_converts_default_string_columns():
+    # from pandas 3 on text columns default to the ``string`` dtype, not object
+    df = pd.DataFrame({'name': ['a', 'b', 'a', 'a', 'b', 'a'], 'n': range(6)})
+    
+    result = AutoDataClean(optimize_dtypes=True).clean(df)
+    
+    assert isinstance(result['name'].dtype, pd.CategoricalDtype)
+    assert result['name'].tolist() == df['name'].tolist()
+
+
+def test_optimize_dtypes_rejects_other_backends():
+    df = pd.DataFrame({'a': ['x', 'x', 'y']})
+    
+    with pytest.raises(ValueError, match="optimize_dtypes"):
+        AutoDataClean(optimize_dtypes=True).clean(df, backend='dask')
+
+
+@pytest.mark.skipif(not auto_data_clean.HAS_DASK, reason="dask is not installed")
+def test_dask_backend_matches_pandas_rows():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({'a': rng.integers(0, 5, 200), 'b': rng.integers(0, 5, 200).astype(float)})
+    df.loc[::7, 'b'] = np.nan
+    cleaner = AutoDataClean()
+    
+    expected, expected_stats = cleaner.clean(df, backend='pandas', return_stats=True)
+    result, stats = cleaner.clean(df, backend='dask', return_stats=True)
+    
+    # dask does not keep row order, so compare the rows as sets
+    assert set(map(tuple, result.to_numpy())) == set(map(tuple, expected.to_numpy()))
+    assert len(result) == len(expected)
+    assert stats == expected_stats
+
+
+def test_frame_without_columns_has_no_duplicates():
+    df = pd.DataFrame(index=range(3))
+    
+    assert AutoDataClean().get_summary(df)['duplicate_rows'] == 0
+    assert len(AutoDataClean(remove_nulls=False).clean(df)) == 3
+
+
+def test_all_null_column_drops_every_row():
+    df = pd.DataFrame({'a': [1, 1, 2], 'b': [np.nan] * 3})
+    
+    result, stats = AutoDataClean().clean(df, return_stats=True)
+    
+    assert result.empty
+    # same counts as the polars and dask backends: (1, nan) repeats first
+    assert stats == {'duplicates_removed': 1, 'nulls_removed': 2}
+
+
+def test_clean_does_not_reuse_summary_of_a_modified_frame():
+    df = pd.DataFrame({'a': [1, 1, 2], 'b': [1, 1, 3]})
+    cleaner = AutoDataClean()
+    cleaner.get_summary(df)
+    df.loc[1, 'a'] = 5
+    
+    assert cleaner.clean(df).values.tolist() == [[1, 1], [5, 1], [2, 3]]
+
+
+def test_clean_reuses_duplicated_mask_from_summary():
+    df = pd.DataFrame({'a': [1, 1, 2], 'b': [1, 1, 3]})
+    cleaner = AutoDataClean()
+    summary, duplicated = cleaner.get_summary(df, return_duplicated=True)
+    
+    result = cleaner.clean(df, duplicated=duplicated)
+    
+    assert summary['duplicate_rows'] == 1
+    assert result.values.tolist() == [[1, 1], [2, 3]]
+
+
+def test_clean_data_without_return_df_only_writes_output(tmp_path, monkeypatch):
+    for has_pyarrow in (True, False):
+        monkeypatch.setattr(auto_data_clean, 'HAS_PYARROW', has_pyarrow)
+        src = tmp_path / 'in.csv'
+        src.write_text("a,b\n1,x\n1,x\n2,\n")
+        out = tmp_path / 'out.csv'
+        
+        assert clean_data(str(src), str(out), chunksize=1, return_df=False) is None
+        assert pd.read_csv(out).values.tolist() == [[1, 'x']]
+
+
+@pytest.mark.skipif(not auto_data_clean.HAS_NUMBA, reason="numba is not installed")
+def test_numba_duplicated_mask_on_integral_floats():
+    # integral floats differ only in their high bits; without a finalizer they
+    # all hash to the same slot and the probe turns quadratic
+    n = max(200_000, auto_data_clean.NUMBA_MIN_ROWS)
+    values = np.arange(n, dtype=np.float64) % (n // 2)
+    df = pd.DataFrame({'a': values, 'b': values * 2.0})
+    auto_data_clean._duplicated_mask(df.head(auto_data_clean.NUMBA_MIN_ROWS))  # compile
+    
+    start = time.perf_counter()
+    mask = auto_data_clean._duplicated_mask(df)
+    elapsed = time.perf_counter() - start
+    
+    assert (mask == df.duplicated().to_numpy()).all()
+    assert elapsed < 2.0
+
+
+@pytest.mark.skipif(not auto_data_clean.HAS_PYARROW, reason="pyarrow is not installed")
+def test_clean_data_arrow_returns_reader_matching_clean_data(tmp_path):
+    src = tmp_path / 'in.csv'
+    src.write_text("a,b\n1,x\n1,x\n2,\n3,y\n")
+    
+    reader = clean_data_arrow(str(src))
+    
+    assert isinstance(reader, auto_data_clean.pa.RecordBatchReader)
+    table = reader.read_all()
+    expected = clean_data(str(src), str(tmp_path / 'out.parquet'))
+    assert table.to_pylist() == expected.to_dict('records')
+
+
+@pytest.mark.skipif(not auto_data_clean.HAS_PYARROW, reason="pyarrow is not installed")
+def test_clean_data_removes_duplicates_across_arrow_blocks(tmp_path, monkeypatch):
+    # tiny blocks put the repeats in different batches from the originals
+    monkeypatch.setattr(auto_data_clean, 'ARROW_BLOCK_SIZE', 16)
+    src = tmp_path / 'in.csv'
+    src.write_text("a,b\n" + "".join(f"{i % 5},{i % 5}\n" for i in range(20)))
+    
+    reader = clean_data_arrow(str(src))
+    batches = list(reader)
+    
+    assert len(batches) > 1
+    assert sum(batch.num_rows for batch in batches) == 5
+    assert auto_data_clean.pa.Table.from_batches(batches).column('a').to_pylist() == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.skipif(not auto_data_clean.HAS_POLARS, reason="polars is not installed")
+def test_polars_backend_on_pandas_and_polars_input():
+    pl = auto_data_clean.pl
+    df = pd.DataFrame({'a': [1, 1, 2, 3], 'b': ['x', 'x', None, 'y']})
+    cleaner = AutoDataClean()
+    
+    from_pandas, stats = cleaner.clean(df, backend='polars', return_stats=True)
+    from_polars = cleaner.clean(pl.from_pandas(df))
+    
+    assert isinstance(from_pandas, pd.DataFrame)
+    assert isinstance(from_polars, pl.DataFrame)
+    assert from_pandas.values.tolist() == [[1, 'x'], [3, 'y']]
+    assert from_polars.rows() == [(1, 'x'), (3, 'y')]
+    assert stats == {'duplicates_removed': 1, 'nulls_removed': 1}
+
+
+def test_inplace_is_deprecated():
+    df = pd.DataFrame({'a': [1, 1]})
+    
+    with pytest.warns(DeprecationWarning, match="inplace"):
+        result = AutoDataClean().clean(df, inplace=True)
+    
+    assert len(result) == 1
+    assert len(df) == 2